@@ -131,10 +131,7 @@ def main():
     from src.backtest.performance import PerformanceAnalyzer
     analyzer = PerformanceAnalyzer(portfolio)
     
-    analyzer.plot_nav()
-    analyzer.plot_drawdown()
-    analyzer.plot_weights()
-    analyzer.plot_returns_distribution()
+    analyzer.plot_all()
     
     # Save results summary
     summary_df = engine.get_results_summary()
@@ -91,10 +91,7 @@ def main():
     from src.backtest.performance import PerformanceAnalyzer
     analyzer = PerformanceAnalyzer(portfolio)
     
-    analyzer.plot_nav()
-    analyzer.plot_drawdown()
-    analyzer.plot_weights()
-    analyzer.plot_returns_distribution()
+    analyzer.plot_all()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,44 @@
+import importlib
+import sys
+import types
+from distutils import log
+from pathlib import Path
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+KERNELS_DIR = Path(__file__).resolve().parent / "src" / "portfolio"
+
+
+def load_kernels_aot():
+    """Import _kernels_aot.py by path, without the package __init__.
+
+    The package __init__ pulls in pandas, which the build environment doesn't
+    have; the kernels only need numpy and numba.
+    """
+    package = types.ModuleType("_portfolio_kernels_build")
+    package.__path__ = [str(KERNELS_DIR)]
+    sys.modules[package.__name__] = package
+    return importlib.import_module(f"{package.__name__}._kernels_aot")
+
+
+class BuildPyWithKernels(build_py):
+    """Compile the numba kernels ahead of time so they ship with the package.
+
+    Uses numba.pycc, which numba has marked pending deprecation (it warns at
+    build time); without the build the kernels are JIT-compiled instead.
+    """
+
+    def run(self):
+        try:
+            cc = load_kernels_aot().cc
+        except ImportError as e:
+            # The kernels are JIT-compiled on first use instead
+            log.warn(f"skipping ahead-of-time kernel build: {e}")
+        else:
+            cc.compile()
+        super().run()
+
 
 setup(
     name="macro-signal-backtester",
@@ -7,15 +47,19 @@ setup(
     description="A quantitative macro signal backtesting framework",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"portfolio": ["*.so", "*.pyd"]},
+    cmdclass={"build_py": BuildPyWithKernels},
     install_requires=[
-        "pandas>=1.5.0",
+        "pandas>=2.2.0",
         "numpy>=1.23.0",
-        "yfinance>=0.2.0",
+        "yfinance>=1.4.0",
         "fredapi>=0.5.0",
         "matplotlib>=3.6.0",
         "seaborn>=0.12.0",
         "pyyaml>=6.0",
         "scipy>=1.9.0",
+        "pyarrow>=10.0.0",
+        "numba>=0.57.0",
     ],
-    python_requires=">=3.8",
-)
\ No newline at end of file
+    python_requires=">=3.9",
+)
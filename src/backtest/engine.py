@@ -13,6 +13,8 @@ from .performance import PerformanceAnalyzer
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SERIES = ['yield_10y', 'yield_2y', 'cpi', 'gdp']
+
 class BacktestEngine:
     """Main backtesting engine that orchestrates the entire process."""
     
@@ -34,6 +36,10 @@ class BacktestEngine:
         self.price_data = pd.DataFrame()
         self.performance_analyzer = None
         
+        # NumPy views of the aligned signal/price data, built once per run
+        self._signal_arr = np.empty((0, 0))
+        self._price_arr = np.empty((0, 0))
+        
     def run(self, start_date: str, end_date: str, 
             rebalance_frequency: str = 'ME') -> Portfolio:  # Changed from 'M' to 'ME'
         """Run the backtest."""
@@ -41,17 +47,10 @@ class BacktestEngine:
         
         # Step 1: Load macro data
         logger.info("Loading macro data...")
-        # Get all required macro series from signals
-        required_series = set()
-        for signal in self.signals.values():
-            # Extract series names from signal parameters
-            for param_value in signal.params.values():
-                if isinstance(param_value, str) and param_value in ['yield_10y', 'yield_2y', 'cpi', 'gdp', 'unemployment', 'vix', 'dollar_index']:
-                    required_series.add(param_value)
-        
-        # Add default series if none found
-        if not required_series:
-            required_series = ['yield_10y', 'yield_2y', 'cpi', 'gdp']
+        # Get all required macro series from signals, with defaults if none found
+        required_series = set().union(
+            *(signal.required_series for signal in self.signals.values())
+        ) or DEFAULT_SERIES
         
         macro_data = self.macro_loader.fetch_multiple_series(
             list(required_series), start_date, end_date
@@ -65,16 +64,19 @@ class BacktestEngine:
         
         # Step 3: Generate signals
         logger.info("Generating signals...")
-        signal_values = {}
-        for name, signal in self.signals.items():
+        signal_names = list(self.signals.keys())
+        signal_matrix = np.empty((len(macro_data.index), len(signal_names)), dtype=np.float32)
+        for j, name in enumerate(signal_names):
             try:
-                signal_values[name] = signal.generate_signal(macro_data)
+                signal_values = self.signals[name].generate_signal(macro_data)
+                signal_matrix[:, j] = signal_values.reindex(macro_data.index).to_numpy()
             except Exception as e:
                 logger.warning(f"Failed to generate signal {name}: {e}")
-                # Create dummy signal if one fails
-                signal_values[name] = pd.Series(0, index=macro_data.index, name=name)
+                # Use a flat signal if one fails
+                signal_matrix[:, j] = 0.0
         
-        self.signal_data = pd.DataFrame(signal_values)
+        self.signal_data = pd.DataFrame(signal_matrix, index=macro_data.index, 
+                                        columns=signal_names, copy=False)
         
         # Step 4: Align all data to common dates
         logger.info("Aligning data...")
@@ -84,6 +86,8 @@ class BacktestEngine:
         
         self.signal_data = self.signal_data.loc[common_dates]
         self.price_data = self.price_data.loc[common_dates]
+        self._signal_arr = self.signal_data.to_numpy(dtype=float)
+        self._price_arr = self.price_data.to_numpy(dtype=float)
         
         # Step 5: Create rebalance dates and ensure they exist in data
         logger.info("Setting up rebalancing schedule...")
@@ -93,20 +97,15 @@ class BacktestEngine:
             freq=rebalance_frequency
         )
         
-        # Find the closest actual dates in our data for each rebalance date
-        actual_rebalance_dates = []
-        for target_date in rebalance_dates:
-            # Find the closest available date (forward fill approach)
-            available_dates = common_dates[common_dates >= target_date]
-            if len(available_dates) > 0:
-                actual_rebalance_dates.append(available_dates[0])
-            else:
-                # If no future dates available, use the last available date
-                if len(common_dates) > 0:
-                    actual_rebalance_dates.append(common_dates[-1])
-        
-        # Remove duplicates while preserving order
-        actual_rebalance_dates = pd.Index(actual_rebalance_dates).drop_duplicates()
+        # Find the closest available date on or after each rebalance date
+        # (forward fill approach), falling back to the last available date
+        rebalance_idx = np.searchsorted(common_dates.values, rebalance_dates.values, 
+                                        side='left')
+        rebalance_idx = np.minimum(rebalance_idx, len(common_dates) - 1)
+        
+        # Remove duplicates (np.unique also keeps chronological order)
+        rebalance_idx = np.unique(rebalance_idx)
+        actual_rebalance_dates = common_dates[rebalance_idx]
         
         logger.info(f"Rebalancing on {len(actual_rebalance_dates)} dates")
         
@@ -117,33 +116,60 @@ class BacktestEngine:
         
         # Step 7: Run strategy and update portfolio
         logger.info("Running strategy...")
-        for i, date in enumerate(actual_rebalance_dates):
-            try:
-                # Get signals and prices for this date
-                current_signals = self.signal_data.loc[date]
-                current_prices = self.price_data.loc[date]
-                
-                # Check for any NaN values and handle them
-                if current_signals.isna().any():
-                    logger.warning(f"NaN signals found on {date}, filling with 0")
-                    current_signals = current_signals.fillna(0)
-                
-                if current_prices.isna().any():
-                    logger.warning(f"NaN prices found on {date}, skipping rebalance")
-                    continue
-                
-                # Calculate target weights
-                weights = self.strategy.calculate_weights(current_signals, current_prices)
-                
-                # Update portfolio
-                self.portfolio.update_holdings(weights, current_prices, date)
-                
-                if i % 10 == 0:  # Log progress every 10 rebalances
-                    logger.info(f"Processed {i+1}/{len(actual_rebalance_dates)} rebalance dates")
-                    
-            except Exception as e:
-                logger.error(f"Error processing date {date}: {e}")
-                continue
+        signal_names = self.signal_data.columns
+        asset_names = self.price_data.columns
+        
+        # Check for any NaN values and handle them for all dates at once:
+        # dates with missing prices are dropped before gathering signals
+        px_mat = self._price_arr[rebalance_idx]
+        px_has_nan = np.isnan(px_mat).any(axis=1)
+        if px_has_nan.any():
+            logger.warning(f"NaN prices found on {px_has_nan.sum()} rebalance dates, "
+                           f"skipping rebalance")
+            rebalance_idx = rebalance_idx[~px_has_nan]
+            px_mat = px_mat[~px_has_nan]
+        
+        # Fancy indexing returns a fresh array, so NaNs can be filled in place
+        sig_mat = self._signal_arr[rebalance_idx]
+        sig_is_nan = np.isnan(sig_mat)
+        if sig_is_nan.any():
+            logger.warning(f"NaN signals found on {sig_is_nan.any(axis=1).sum()} "
+                           f"rebalance dates, filling with 0")
+            sig_mat[sig_is_nan] = 0.0
+        
+        valid_dates = common_dates[rebalance_idx]
+        valid = np.ones(len(valid_dates), dtype=bool)
+        try:
+            # Calculate target weights for all rebalance dates at once
+            weights = self.strategy.calculate_weights_vectorized(
+                pd.DataFrame(sig_mat, index=valid_dates, columns=signal_names, copy=False),
+                pd.DataFrame(px_mat, index=valid_dates, columns=asset_names, copy=False)
+            )
+            weights_mat = weights.reindex(columns=asset_names, fill_value=0).to_numpy(dtype=float)
+        except Exception as e:
+            # Fall back to date by date so one bad date only skips itself
+            logger.warning(f"Vectorized weight calculation failed ({e}), "
+                           f"calculating weights per date")
+            weights_mat = np.zeros((len(valid_dates), len(asset_names)))
+            for i, date in enumerate(valid_dates):
+                try:
+                    weights = self.strategy.calculate_weights(
+                        pd.Series(sig_mat[i], index=signal_names),
+                        pd.Series(px_mat[i], index=asset_names)
+                    )
+                    weights_mat[i] = weights.reindex(asset_names, fill_value=0).to_numpy()
+                except Exception as e:
+                    logger.error(f"Error processing date {date}: {e}")
+                    valid[i] = False
+        
+        # Update portfolio for all rebalance dates in one batch
+        rebalance_index = valid_dates[valid]
+        self.portfolio.preallocate(rebalance_index, list(asset_names))
+        self.portfolio.update_holdings_batch(
+            pd.DataFrame(weights_mat[valid], index=rebalance_index, columns=asset_names),
+            pd.DataFrame(px_mat[valid], index=rebalance_index, columns=asset_names)
+        )
+        logger.info(f"Processed {valid.sum()}/{len(actual_rebalance_dates)} rebalance dates")
         
         # Step 8: Calculate final NAV and returns
         logger.info("Calculating performance...")
@@ -165,20 +191,20 @@ class BacktestEngine:
         metrics = self.portfolio.get_performance_metrics()
         
         # Add signal statistics
-        signal_stats = {}
-        for name, signal_series in self.signal_data.items():
-            clean_signal = signal_series.dropna()
-            if len(clean_signal) > 0:
-                signal_stats[f"{name}_mean"] = clean_signal.mean()
-                signal_stats[f"{name}_std"] = clean_signal.std()
-                signal_stats[f"{name}_skew"] = clean_signal.skew()
+        stats = self.signal_data.agg(['mean', 'std', 'skew'])
+        has_data = self.signal_data.count() > 0
+        signal_stats = {
+            f"{name}_{stat}": float(stats.at[stat, name])
+            for name in stats.columns if has_data[name]
+            for stat in stats.index
+        }
         
         metrics.update(signal_stats)
         
         # Add turnover statistics
         if not self.portfolio.trades.empty:
             turnover = self.portfolio.trades.abs().sum(axis=1).mean()
-            metrics['avg_daily_turnover'] = turnover
+            metrics['avg_daily_turnover'] = float(turnover)
         
         return metrics
     
@@ -193,21 +219,31 @@ class BacktestEngine:
         if not self.portfolio.nav.empty:
             common_dates = self.portfolio.nav.index
             
-            summary_data['NAV'] = self.portfolio.nav
-            summary_data['Returns'] = self.portfolio.returns
-            summary_data['Cash'] = self.portfolio.cash
+            cash = self.portfolio.cash
+            if not cash.index.equals(common_dates):
+                cash = cash.reindex(common_dates)
             
-            # Add weights for each asset (reindex to common dates)
+            summary_data['NAV'] = self.portfolio.nav.to_numpy()
+            summary_data['Returns'] = self.portfolio.returns.reindex(common_dates).to_numpy()
+            summary_data['Cash'] = cash.to_numpy()
+            
+            # Add weights for each asset (reindex to common dates if needed)
             if not self.portfolio.weights.empty:
-                weights_aligned = self.portfolio.weights.reindex(common_dates, method='ffill')
+                weights_aligned = self.portfolio.weights
+                if not weights_aligned.index.equals(common_dates):
+                    weights_aligned = weights_aligned.reindex(common_dates, method='ffill')
                 for asset in self.strategy.universe:
                     if asset in weights_aligned.columns:
-                        summary_data[f'Weight_{asset}'] = weights_aligned[asset]
+                        summary_data[f'Weight_{asset}'] = weights_aligned[asset].to_numpy()
             
-            # Add signal values (reindex to common dates)
+            # Add signal values (reindex to common dates if needed)
             if not self.signal_data.empty:
-                signals_aligned = self.signal_data.reindex(common_dates, method='ffill')
+                signals_aligned = self.signal_data
+                if not signals_aligned.index.equals(common_dates):
+                    signals_aligned = signals_aligned.reindex(common_dates, method='ffill')
                 for signal_name in signals_aligned.columns:
-                    summary_data[f'Signal_{signal_name}'] = signals_aligned[signal_name]
+                    summary_data[f'Signal_{signal_name}'] = signals_aligned[signal_name].to_numpy()
+            
+            return pd.DataFrame(summary_data, index=common_dates, copy=False)
         
         return pd.DataFrame(summary_data)
\ No newline at end of file
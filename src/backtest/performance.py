@@ -11,9 +11,12 @@ class PerformanceAnalyzer:
     def __init__(self, portfolio: Portfolio):
         self.portfolio = portfolio
         
-    def plot_nav(self, figsize: Tuple[int, int] = (12, 6)) -> None:
-        """Plot portfolio NAV over time."""
-        fig, ax = plt.subplots(figsize=figsize)
+    def plot_nav(self, figsize: Tuple[int, int] = (12, 6), 
+                 ax: Optional[plt.Axes] = None) -> None:
+        """Plot portfolio NAV over time (on ``ax`` if given)."""
+        show = ax is None
+        if show:
+            fig, ax = plt.subplots(figsize=figsize)
         
         self.portfolio.nav.plot(ax=ax, linewidth=2, color='navy')
         ax.set_title('Portfolio Net Asset Value', fontsize=14, fontweight='bold')
@@ -26,12 +29,17 @@ class PerformanceAnalyzer:
                    linestyle='--', label='Initial Capital')
         ax.legend()
         
-        plt.tight_layout()
-        plt.show()
+        if show:
+            plt.tight_layout()
+            plt.show()
     
-    def plot_returns_distribution(self, figsize: Tuple[int, int] = (12, 6)) -> None:
-        """Plot returns distribution."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+    def plot_returns_distribution(self, figsize: Tuple[int, int] = (12, 6),
+                                  axes: Optional[Tuple[plt.Axes, plt.Axes]] = None) -> None:
+        """Plot returns distribution (on the histogram and Q-Q ``axes`` if given)."""
+        show = axes is None
+        if show:
+            fig, axes = plt.subplots(1, 2, figsize=figsize)
+        ax1, ax2 = axes
         
         returns = self.portfolio.returns.dropna()
         
@@ -50,18 +58,24 @@ class PerformanceAnalyzer:
         ax2.set_title('Q-Q Plot', fontsize=12)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.show()
+        if show:
+            plt.tight_layout()
+            plt.show()
     
-    def plot_drawdown(self, figsize: Tuple[int, int] = (12, 6)) -> None:
-        """Plot drawdown chart."""
-        cumulative = (1 + self.portfolio.returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
+    def plot_drawdown(self, figsize: Tuple[int, int] = (12, 6), 
+                      ax: Optional[plt.Axes] = None) -> None:
+        """Plot drawdown chart (on ``ax`` if given)."""
+        returns = self.portfolio.returns.dropna()
+        dates = returns.index
+        cumulative = np.cumprod(1 + returns.to_numpy())
+        running_max = np.maximum.accumulate(cumulative)
+        drawdown = cumulative / running_max - 1
         
-        fig, ax = plt.subplots(figsize=figsize)
-        drawdown.plot(ax=ax, linewidth=1, color='red', label='Drawdown')
-        ax.fill_between(drawdown.index, 0, drawdown, color='red', alpha=0.3)
+        show = ax is None
+        if show:
+            fig, ax = plt.subplots(figsize=figsize)
+        ax.plot(dates, drawdown, linewidth=1, color='red', label='Drawdown')
+        ax.fill_between(dates, 0, drawdown, color='red', alpha=0.3)
         
         ax.set_title('Portfolio Drawdown', fontsize=14, fontweight='bold')
         ax.set_xlabel('Date', fontsize=12)
@@ -70,26 +84,31 @@ class PerformanceAnalyzer:
         ax.set_ylim(top=0.05)
         
         # Mark maximum drawdown
-        max_dd_date = drawdown.idxmin()
-        max_dd_value = drawdown.min()
+        max_dd_pos = np.argmin(drawdown)
+        max_dd_date = dates[max_dd_pos]
+        max_dd_value = drawdown[max_dd_pos]
         ax.plot(max_dd_date, max_dd_value, 'ko', markersize=8)
         ax.annotate(f'Max DD: {max_dd_value:.2%}', 
                     xy=(max_dd_date, max_dd_value),
                     xytext=(10, 10), textcoords='offset points',
                     bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.7))
         
-        plt.tight_layout()
-        plt.show()
+        if show:
+            plt.tight_layout()
+            plt.show()
     
-    def plot_weights(self, figsize: Tuple[int, int] = (12, 8)) -> None:
-        """Plot portfolio weights over time."""
+    def plot_weights(self, figsize: Tuple[int, int] = (12, 8), 
+                     ax: Optional[plt.Axes] = None) -> None:
+        """Plot portfolio weights over time (on ``ax`` if given)."""
         weights = self.portfolio.weights
         
         if weights.empty:
             print("No weights to plot")
             return
         
-        fig, ax = plt.subplots(figsize=figsize)
+        show = ax is None
+        if show:
+            fig, ax = plt.subplots(figsize=figsize)
         
         # Create stacked area chart
         weights.plot.area(ax=ax, stacked=True, alpha=0.8)
@@ -101,6 +120,22 @@ class PerformanceAnalyzer:
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
         
+        if show:
+            plt.tight_layout()
+            plt.show()
+    
+    def plot_all(self, figsize: Tuple[int, int] = (16, 12)) -> None:
+        """Plot NAV, drawdown, weights and returns distribution in one figure."""
+        fig = plt.figure(figsize=figsize)
+        grid = fig.add_gridspec(3, 2)
+        
+        self.plot_nav(ax=fig.add_subplot(grid[0, :]))
+        self.plot_drawdown(ax=fig.add_subplot(grid[1, 0]))
+        self.plot_weights(ax=fig.add_subplot(grid[1, 1]))
+        self.plot_returns_distribution(
+            axes=(fig.add_subplot(grid[2, 0]), fig.add_subplot(grid[2, 1]))
+        )
+        
         plt.tight_layout()
         plt.show()
     
@@ -111,16 +146,21 @@ class PerformanceAnalyzer:
         # Add additional metrics
         returns = self.portfolio.returns.dropna()
         
-        # Risk metrics
-        metrics['var_95'] = returns.quantile(0.05) * 100
-        metrics['cvar_95'] = returns[returns <= returns.quantile(0.05)].mean() * 100
-        metrics['kurtosis'] = returns.kurtosis()
-        metrics['skewness'] = returns.skew()
-        
-        # Monthly aggregation
-        monthly_returns = returns.resample('M').apply(lambda x: (1 + x).prod() - 1)
-        metrics['best_month'] = monthly_returns.max() * 100
-        metrics['worst_month'] = monthly_returns.min() * 100
-        metrics['positive_months'] = (monthly_returns > 0).mean() * 100
+        # Risk metrics; the tail mean is a masked sum rather than a selection
+        var_95 = returns.quantile(0.05)
+        returns_arr = returns.to_numpy()
+        in_tail = returns_arr <= var_95
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cvar_95 = np.sum(returns_arr, where=in_tail) / in_tail.sum()
+        metrics['var_95'] = float(var_95) * 100
+        metrics['cvar_95'] = float(cvar_95) * 100
+        metrics['kurtosis'] = float(returns.kurtosis())
+        metrics['skewness'] = float(returns.skew())
+        
+        # Monthly aggregation (compounded via log returns)
+        monthly_returns = np.expm1(np.log1p(returns).resample('ME').sum())
+        metrics['best_month'] = float(monthly_returns.max()) * 100
+        metrics['worst_month'] = float(monthly_returns.min()) * 100
+        metrics['positive_months'] = float((monthly_returns > 0).mean()) * 100
         
         return metrics
\ No newline at end of file
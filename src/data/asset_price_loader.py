@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from .base_loader import BaseDataLoader
 
@@ -31,13 +32,14 @@ class AssetPriceLoader(BaseDataLoader):
             if data.empty:
                 raise ValueError(f"No data found for ticker {ticker}")
             
-            # Extract specific price type
-            if data_type in data.columns:
-                df = pd.DataFrame(data[data_type])
-                df.columns = [ticker]
-            else:
-                df = pd.DataFrame(data['Close'])
-                df.columns = [ticker]
+            # Extract specific price type; newer yfinance nests a (upper-cased)
+            # ticker level under it, so take the single column by position
+            # and label it with the ticker as requested
+            price_type = data_type if data_type in data.columns else 'Close'
+            prices = data[price_type]
+            if isinstance(prices, pd.DataFrame):
+                prices = prices.iloc[:, 0]
+            df = prices.to_frame(ticker)
             
             # Clean and cache
             df = self.clean_data(df)
@@ -52,14 +54,84 @@ class AssetPriceLoader(BaseDataLoader):
     
     def fetch_multiple_assets(self, tickers: List[str], start_date: str, 
                             end_date: str, data_type: str = 'Close') -> pd.DataFrame:
-        """Fetch price data for multiple assets."""
-        dfs = []
+        """Fetch price data for multiple assets with a single batched download."""
+        start, end = self._validate_dates(start_date, end_date)
+        
+        # Serve what we can from cache and download the rest in one request
+        frames = {}
+        to_fetch = []
         for ticker in tickers:
-            df = self.fetch_data(ticker, start_date, end_date, data_type)
-            dfs.append(df)
+            cache_key = f"{ticker}_{start_date}_{end_date}_{data_type}"
+            cached_data = self.get_cached_data(cache_key)
+            if cached_data is not None:
+                frames[ticker] = cached_data
+            else:
+                to_fetch.append(ticker)
+        
+        if to_fetch:
+            try:
+                data = yf.download(tickers=" ".join(to_fetch), start=start, end=end,
+                                   progress=False, group_by='ticker', threads=True)
+            except Exception as e:
+                logger.error(f"Error fetching {', '.join(to_fetch)}: {e}")
+                raise
+            
+            missing = []
+            if data.empty:
+                missing = list(to_fetch)
+            else:
+                # Extract specific price type, one column per ticker
+                if isinstance(data.columns, pd.MultiIndex):
+                    price_level = data.columns.get_level_values(1)
+                    price_type = data_type if data_type in price_level else 'Close'
+                    prices = data.xs(price_type, axis=1, level=1)
+                else:
+                    # Older yfinance returns flat price columns for one ticker
+                    price_type = data_type if data_type in data.columns else 'Close'
+                    prices = data[[price_type]].set_axis(to_fetch, axis=1)
+                
+                for ticker in to_fetch:
+                    # yfinance labels columns with upper-cased symbols
+                    column = ticker if ticker in prices.columns else ticker.upper()
+                    if column not in prices.columns or prices[column].isna().all():
+                        missing.append(ticker)
+                        continue
+                    
+                    # Clean and cache, labelled with the ticker as requested
+                    df = self.clean_data(prices[column].to_frame(ticker))
+                    self.cache_data(f"{ticker}_{start_date}_{end_date}_{data_type}", df)
+                    frames[ticker] = df
+                
+                logger.info(f"Successfully fetched {len(to_fetch) - len(missing)} tickers "
+                            f"from {start_date} to {end_date}")
+            
+            # Retry tickers the batched request came back empty for one by one,
+            # in parallel since each request is dominated by network wait
+            # (yfinance >= 1.4 keeps download state per call, so this is safe)
+            if missing:
+                logger.warning(f"Batched download returned no data for "
+                               f"{', '.join(missing)}, retrying individually")
+                with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                    futures = {
+                        executor.submit(self.fetch_data, ticker, start_date, 
+                                        end_date, data_type): ticker
+                        for ticker in missing
+                    }
+                    for future in as_completed(futures):
+                        frames[futures[future]] = future.result()
+        
+        # Combine all assets into one preallocated float32 block on the union
+        # of dates (prices need far less than float64 precision)
+        union_index = frames[tickers[0]].index
+        for ticker in tickers[1:]:
+            union_index = union_index.union(frames[ticker].index)
+        
+        arr = np.full((len(union_index), len(tickers)), np.nan, dtype=np.float32)
+        for j, ticker in enumerate(tickers):
+            df = frames[ticker]
+            arr[union_index.get_indexer(df.index), j] = df.iloc[:, 0].to_numpy()
         
-        # Combine all assets
-        combined = pd.concat(dfs, axis=1)
+        combined = pd.DataFrame(arr, index=union_index, columns=tickers, copy=False)
         return combined
     
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -70,8 +142,9 @@ class AssetPriceLoader(BaseDataLoader):
         # Drop any remaining NaN rows
         df = df.dropna()
         
-        # Ensure datetime index
-        df.index = pd.to_datetime(df.index)
+        # Ensure datetime index (yfinance already returns one)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index)
         
         return df
     
@@ -80,8 +153,8 @@ class AssetPriceLoader(BaseDataLoader):
         if method == 'simple':
             return prices.pct_change()
         elif method == 'log':
-            log_returns = np.log(prices / prices.shift(1))
-            return pd.DataFrame(log_returns, index=prices.index, columns=prices.columns)
+            # log(p_t / p_{t-1}) == log1p(simple return), more accurate near zero
+            return np.log1p(prices.pct_change(fill_method=None))
         else:
             raise ValueError(f"Unknown return method: {method}")
     
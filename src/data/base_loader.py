@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Optional, Dict, Any
+import hashlib
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = Path.home() / '.macro_backtester_cache'
+
 class BaseDataLoader(ABC):
     """Abstract base class for all data loaders."""
     
@@ -12,6 +17,16 @@ class BaseDataLoader(ABC):
         self.config = config or {}
         self._cache = {}
         
+        # On-disk cache shared across runs; set 'cache_dir' to None to disable
+        cache_dir = self.config.get('cache_dir', DEFAULT_CACHE_DIR)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Disk cache disabled, cannot create {self.cache_dir}: {e}")
+                self.cache_dir = None
+        
     @abstractmethod
     def fetch_data(self, identifier: str, start_date: str, end_date: str) -> pd.DataFrame:
         """Fetch data for a given identifier and date range."""
@@ -29,10 +44,51 @@ class BaseDataLoader(ABC):
             logger.error(f"Date validation error: {e}")
             raise
     
+    def _cache_path(self, key: str) -> Path:
+        """Get the on-disk cache file for a cache key."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.parquet"
+    
+    @staticmethod
+    def _freeze(data: pd.DataFrame) -> pd.DataFrame:
+        """Mark a frame's NumPy blocks read-only (Arrow arrays already are)."""
+        # Columns are views into the blocks, so the blocks themselves are frozen
+        for values in data._mgr.arrays:
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+        return data
+    
     def get_cached_data(self, key: str) -> Optional[pd.DataFrame]:
-        """Retrieve data from cache if available."""
-        return self._cache.get(key)
+        """Retrieve data from cache if available.
+        
+        The frame shares the cache's read-only values, so modifying them
+        raises; callers that need to write must copy.
+        """
+        if key in self._cache:
+            return self._cache[key].copy(deep=False)
+        
+        if self.cache_dir is None:
+            return None
+        
+        path = self._cache_path(key)
+        if not path.exists():
+            return None
+        
+        try:
+            data = pd.read_parquet(path, engine='pyarrow', memory_map=True)
+        except Exception as e:
+            logger.warning(f"Failed to read cache file {path}: {e}")
+            return None
+        
+        self._cache[key] = self._freeze(data)
+        return data.copy(deep=False)
     
     def cache_data(self, key: str, data: pd.DataFrame) -> None:
-        """Store data in cache."""
-        self._cache[key] = data.copy()
\ No newline at end of file
+        """Store data in cache without copying; its values become read-only."""
+        self._cache[key] = self._freeze(data.copy(deep=False))
+        
+        if self.cache_dir is not None:
+            try:
+                data.to_parquet(self._cache_path(key), engine='pyarrow', compression='zstd')
+            except Exception as e:
+                logger.warning(f"Failed to write cache file for {key}: {e}")
\ No newline at end of file
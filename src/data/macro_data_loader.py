@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from fredapi import Fred
 from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from .base_loader import BaseDataLoader
 
@@ -32,7 +33,7 @@ class MacroDataLoader(BaseDataLoader):
         cache_key = f"{identifier}_{start_date}_{end_date}"
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
-            return cached_data
+            return self._apply_dtype_backend(cached_data)
         
         try:
             # Map identifier to FRED series if needed
@@ -48,7 +49,7 @@ class MacroDataLoader(BaseDataLoader):
             self.cache_data(cache_key, df)
             
             logger.info(f"Successfully fetched {identifier} from {start_date} to {end_date}")
-            return df
+            return self._apply_dtype_backend(df)
             
         except Exception as e:
             logger.error(f"Error fetching {identifier}: {e}")
@@ -57,13 +58,27 @@ class MacroDataLoader(BaseDataLoader):
     def fetch_multiple_series(self, identifiers: List[str], start_date: str, 
                             end_date: str) -> pd.DataFrame:
         """Fetch multiple macro series and combine them."""
-        dfs = []
+        results = {}
+        to_fetch = []
         for identifier in identifiers:
-            df = self.fetch_data(identifier, start_date, end_date)
-            dfs.append(df)
+            cached_data = self.get_cached_data(f"{identifier}_{start_date}_{end_date}")
+            if cached_data is not None:
+                results[identifier] = self._apply_dtype_backend(cached_data)
+            else:
+                to_fetch.append(identifier)
         
-        # Combine all series
-        combined = pd.concat(dfs, axis=1)
+        # Each FRED request is a blocking round-trip, so fetch in parallel
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_fetch))) as executor:
+                futures = {
+                    executor.submit(self.fetch_data, identifier, start_date, end_date): identifier
+                    for identifier in to_fetch
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        # Combine all series in the requested order
+        combined = pd.concat([results[identifier] for identifier in identifiers], axis=1)
         return combined
     
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -74,11 +89,25 @@ class MacroDataLoader(BaseDataLoader):
         # Remove any remaining NaN rows
         df = df.dropna()
         
-        # Ensure datetime index
-        df.index = pd.to_datetime(df.index)
+        # Ensure datetime index (FRED series already have one)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            df.index = pd.to_datetime(df.index, cache=True)
         
         return df
     
+    def _apply_dtype_backend(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cast data to the configured dtype backend.
+        
+        Data can optionally be kept Arrow-backed ({'dtype_backend': 'pyarrow'});
+        signals and the portfolio convert to NumPy at their kernel boundary.
+        Applied on every return path, since cached data may have been stored
+        under either backend.
+        """
+        arrow = [isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes]
+        if self.config.get('dtype_backend') == 'pyarrow':
+            return df if all(arrow) else df.astype('float64[pyarrow]')
+        return df.astype(np.float64) if any(arrow) else df
+    
     def resample_to_frequency(self, df: pd.DataFrame, freq: str = 'M') -> pd.DataFrame:
         """Resample data to specified frequency."""
         return df.resample(freq).last()
@@ -86,7 +115,30 @@ class MacroDataLoader(BaseDataLoader):
     def calculate_changes(self, df: pd.DataFrame, periods: int = 1, 
                          pct_change: bool = True) -> pd.DataFrame:
         """Calculate period-over-period changes."""
-        if pct_change:
-            return df.pct_change(periods)
+        changes = self.calculate_changes_np(df.to_numpy(dtype=float), periods, pct_change)
+        return pd.DataFrame(changes, index=df.index, columns=df.columns, copy=False)
+    
+    @staticmethod
+    def calculate_changes_np(arr: np.ndarray, periods: int = 1, 
+                             pct: bool = True) -> np.ndarray:
+        """Period-over-period changes of an array along its first axis.
+        
+        Rows without a row ``periods`` earlier are NaN; missing values are
+        not filled before differencing.
+        """
+        out = np.full(arr.shape, np.nan)
+        if periods == 0:
+            current, previous, target = arr, arr, out
+        elif periods > 0:
+            current, previous, target = arr[periods:], arr[:-periods], out[periods:]
+        else:
+            current, previous, target = arr[:periods], arr[-periods:], out[:periods]
+        
+        # Write straight into the output slice
+        if pct:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(current, previous, out=target)
+            target -= 1
         else:
-            return df.diff(periods)
\ No newline at end of file
+            np.subtract(current, previous, out=target)
+        return out
\ No newline at end of file
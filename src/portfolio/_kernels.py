@@ -0,0 +1,75 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from numba import njit
+
+# Fingerprint of this file, baked into the prebuilt module so a stale build
+# can be detected at import time
+SOURCE_DIGEST = int(hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:15], 16)
+
+@njit(cache=True)
+def compute_nav(holdings: np.ndarray, prices: np.ndarray,
+                price_idx: np.ndarray, cash: np.ndarray) -> np.ndarray:
+    """Mark holdings to market: row i uses prices[price_idx[i]] plus cash[i].
+
+    NaN holdings or prices contribute nothing, matching pandas' skipna sum.
+    Sums accumulate in float64; the result is stored as float32.
+    """
+    n_dates, n_assets = holdings.shape
+    nav = np.empty(n_dates, dtype=np.float32)
+    for i in range(n_dates):
+        j = price_idx[i]
+        value = 0.0
+        for k in range(n_assets):
+            position = holdings[i, k] * prices[j, k]
+            if not np.isnan(position):
+                value += position
+        nav[i] = value + cash[i]
+    return nav
+
+@njit(cache=True)
+def return_stats(returns: np.ndarray):
+    """Summary statistics of a returns series in one pass.
+
+    Returns (count, mean, std, max drawdown, win count, win sum, loss count,
+    loss sum). NaN returns are skipped; std uses ddof=1 (NaN for fewer than
+    two observations), with mean and variance updated by Welford's method.
+    The drawdown peak starts at the first compounded value (not initial
+    capital), matching pandas' cumprod/expanding max.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    cum = 1.0
+    peak = -np.inf
+    max_dd = 0.0
+    n_win = 0
+    sum_win = 0.0
+    n_loss = 0
+    sum_loss = 0.0
+    for r in returns:
+        if np.isnan(r):
+            continue
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+
+        cum *= 1.0 + r
+        if cum > peak:
+            peak = cum
+        dd = cum / peak - 1.0
+        if dd < max_dd:
+            max_dd = dd
+
+        if r > 0.0:
+            n_win += 1
+            sum_win += r
+        elif r < 0.0:
+            n_loss += 1
+            sum_loss += r
+
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return (float(n), mean, std, max_dd,
+            float(n_win), sum_win, float(n_loss), sum_loss)
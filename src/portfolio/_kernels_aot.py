@@ -0,0 +1,25 @@
+from numba.pycc import CC
+
+from ._kernels import SOURCE_DIGEST, compute_nav, return_stats
+
+# Ahead-of-time build of the JIT kernels in _kernels.py. Compiled by setup.py
+# (or `python -m src.portfolio._kernels_aot`) into this package's directory.
+# numba.pycc is pending deprecation in numba; the JIT kernels are the
+# fallback once it goes away.
+#
+# Compiled exports don't check argument types the way the JIT dispatcher
+# does: callers must pass exactly the dtypes in these signatures.
+cc = CC('_portfolio_kernels')
+
+
+def source_digest():
+    return SOURCE_DIGEST
+
+
+cc.export('source_digest', 'i8()')(source_digest)
+
+cc.export('compute_nav', 'f4[:](f8[:,:], f8[:,:], i8[:], f8[:])')(compute_nav.py_func)
+cc.export('return_stats', 'UniTuple(f8, 8)(f8[:])')(return_stats.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
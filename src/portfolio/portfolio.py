@@ -1,10 +1,32 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 import logging
 
+from . import _kernels
+
 logger = logging.getLogger(__name__)
 
+def _load_kernels():
+    """Use the ahead-of-time compiled kernels if built from the current _kernels.py."""
+    try:
+        from . import _portfolio_kernels as prebuilt
+    except ImportError:
+        return _kernels
+    
+    # A module built from older kernels would otherwise run silently
+    digest = getattr(prebuilt, 'source_digest', None)
+    if digest is None or digest() != _kernels.SOURCE_DIGEST:
+        logger.warning("Prebuilt _portfolio_kernels is out of date with _kernels.py, "
+                       "using the JIT kernels (rebuild with "
+                       "`python -m src.portfolio._kernels_aot`)")
+        return _kernels
+    return prebuilt
+
+_kernel_module = _load_kernels()
+compute_nav = _kernel_module.compute_nav
+return_stats = _kernel_module.return_stats
+
 class Portfolio:
     """Portfolio tracking and performance calculation."""
     
@@ -13,17 +35,121 @@ class Portfolio:
         self.initial_capital = initial_capital
         self.transaction_cost = transaction_cost
         
-        # Initialize tracking DataFrames with proper dtypes
-        self.holdings = pd.DataFrame()
-        self.weights = pd.DataFrame()
-        self.trades = pd.DataFrame()
-        self.cash = pd.Series(dtype=float, name='cash')
+        # Updates are buffered per call and concatenated once on first access
+        # (see the holdings/weights/trades/cash properties)
+        self._holdings_blocks: List[pd.DataFrame] = []
+        self._weights_blocks: List[pd.DataFrame] = []
+        self._trades_blocks: List[pd.DataFrame] = []
+        self._cash_blocks: List[pd.Series] = []
+        self._last_shares = pd.Series(dtype=float)
+        self._last_cash = initial_capital
+        
+        # Fixed-size storage used instead of the blocks once preallocate()
+        # has been called; _filled marks the rows written so far
+        self._dates: Optional[pd.DatetimeIndex] = None
+        self._assets: Optional[pd.Index] = None
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._filled: Optional[np.ndarray] = None
+        self._frames: Dict[str, Any] = {}
+        
         self.nav = pd.Series(dtype=float, name='nav')
         self.returns = pd.Series(dtype=float, name='returns')
+    
+    def preallocate(self, dates: pd.DatetimeIndex, assets: List[str]) -> None:
+        """Reserve fixed-size storage for known rebalance dates and assets.
+        
+        Subsequent updates are written into preallocated arrays by row
+        instead of being buffered as blocks; they must fall on ``dates``
+        and only ``assets`` are tracked.
+        """
+        n_dates, n_assets = len(dates), len(assets)
+        self._dates = pd.DatetimeIndex(dates)
+        self._assets = pd.Index(assets)
+        self._arrays = {
+            'holdings': np.zeros((n_dates, n_assets)),
+            'weights': np.zeros((n_dates, n_assets)),
+            'trades': np.zeros((n_dates, n_assets)),
+            'cash': np.empty(n_dates),
+        }
+        self._filled = np.zeros(n_dates, dtype=bool)
+        self._frames = {}
+    
+    @staticmethod
+    def _materialize(blocks: list):
+        """Concatenate buffered update blocks in place and return the result."""
+        if len(blocks) > 1:
+            blocks[:] = [pd.concat(blocks)]
+        return blocks[0] if blocks else None
+    
+    def _tracked(self, name: str):
+        """Get a tracked frame from the blocks or the preallocated arrays."""
+        if self._filled is None:
+            return self._materialize(getattr(self, f'_{name}_blocks'))
+        
+        # Build from the written rows once per update
+        if name not in self._frames:
+            if not self._filled.any():
+                return None
+            rows = self._filled
+            values = self._arrays[name][rows]
+            if name == 'cash':
+                frame = pd.Series(values, index=self._dates[rows], name='cash')
+            else:
+                frame = pd.DataFrame(values, index=self._dates[rows],
+                                     columns=self._assets, copy=False)
+            self._frames[name] = frame
+        return self._frames[name]
+    
+    @property
+    def holdings(self) -> pd.DataFrame:
+        """Holdings in shares on each rebalance date."""
+        holdings = self._tracked('holdings')
+        return pd.DataFrame() if holdings is None else holdings
+    
+    @property
+    def weights(self) -> pd.DataFrame:
+        """Target weights on each rebalance date."""
+        weights = self._tracked('weights')
+        return pd.DataFrame() if weights is None else weights
+    
+    @property
+    def trades(self) -> pd.DataFrame:
+        """Traded shares on each rebalance date."""
+        trades = self._tracked('trades')
+        return pd.DataFrame() if trades is None else trades
+    
+    @property
+    def cash(self) -> pd.Series:
+        """Cash balance after each rebalance."""
+        cash = self._tracked('cash')
+        return pd.Series(dtype=float, name='cash') if cash is None else cash
         
     def update_holdings(self, target_weights: pd.Series, prices: pd.Series, 
                        date: pd.Timestamp) -> None:
         """Update portfolio holdings based on target weights."""
+        self.update_holdings_batch(
+            pd.DataFrame([target_weights], index=[date]),
+            pd.DataFrame([prices], index=[date])
+        )
+    
+    def update_holdings_batch(self, target_weights: pd.DataFrame, 
+                              prices: pd.DataFrame) -> None:
+        """Update portfolio holdings for a batch of rebalance dates at once.
+        
+        Rows of ``target_weights`` are rebalance dates in chronological order;
+        ``prices`` must cover the same dates and assets.
+        """
+        if target_weights.empty:
+            return
+        
+        if self._assets is not None:
+            target_weights = target_weights.reindex(columns=self._assets, fill_value=0)
+        prices = prices.reindex(index=target_weights.index, 
+                                columns=target_weights.columns)
+        # Copied since the weights are kept in the tracked frames
+        weights_arr = target_weights.to_numpy(dtype=float, copy=True)
+        prices_arr = prices.to_numpy(dtype=float)
+        
         # Calculate current portfolio value
         if self.nav.empty:
             current_nav = self.initial_capital
@@ -31,112 +157,98 @@ class Portfolio:
             current_nav = self.nav.iloc[-1]
         
         # Calculate target holdings in shares
-        target_value = target_weights * current_nav
-        target_shares = target_value / prices
+        target_shares = weights_arr * current_nav / prices_arr
         
-        # Calculate trades needed
-        if self.holdings.empty:
-            current_shares = pd.Series(0, index=target_shares.index, dtype=float)
-        else:
-            current_shares = self.holdings.iloc[-1].reindex(target_shares.index, fill_value=0)
+        # Shares held going into each rebalance are the previous row's targets
+        current_shares = np.empty_like(target_shares)
+        current_shares[1:] = target_shares[:-1]
+        current_shares[0] = self._last_shares.reindex(
+            target_weights.columns, fill_value=0).to_numpy(dtype=float)
         
         trades = target_shares - current_shares
         
-        # Calculate transaction costs
-        trade_value = (trades.abs() * prices).sum()
+        # Calculate transaction costs (NaN trades, e.g. from missing prices,
+        # are skipped like pandas' sum so they don't carry into the cash)
+        trade_value = np.nansum(np.abs(trades) * prices_arr, axis=1)
         costs = trade_value * self.transaction_cost
         
         # Update cash position
-        cash_change = -(trades * prices).sum() - costs
-        if self.cash.empty:
-            new_cash = self.initial_capital + cash_change
-        else:
-            new_cash = self.cash.iloc[-1] + cash_change
+        cash_change = -np.nansum(trades * prices_arr, axis=1) - costs
+        new_cash = self._last_cash + np.cumsum(cash_change)
         
-        # Store updates using proper concatenation
-        new_holdings = pd.DataFrame([target_shares], index=[date])
-        new_weights = pd.DataFrame([target_weights], index=[date])
-        new_trades = pd.DataFrame([trades], index=[date])
-        new_cash_series = pd.Series([new_cash], index=[date], name='cash')
-        
-        # Concatenate properly
-        if self.holdings.empty:
-            self.holdings = new_holdings
-        else:
-            self.holdings = pd.concat([self.holdings, new_holdings])
-            
-        if self.weights.empty:
-            self.weights = new_weights
+        index = target_weights.index
+        columns = target_weights.columns
+        if self._filled is not None:
+            # Write rows straight into the preallocated arrays
+            rows = self._dates.get_indexer(index)
+            if (rows < 0).any():
+                raise ValueError("Rebalance dates must be within the preallocated dates")
+            self._arrays['holdings'][rows] = target_shares
+            self._arrays['weights'][rows] = weights_arr
+            self._arrays['trades'][rows] = trades
+            self._arrays['cash'][rows] = new_cash
+            self._filled[rows] = True
+            self._frames = {}
         else:
-            self.weights = pd.concat([self.weights, new_weights])
-            
-        if self.trades.empty:
-            self.trades = new_trades
-        else:
-            self.trades = pd.concat([self.trades, new_trades])
-            
-        if self.cash.empty:
-            self.cash = new_cash_series
-        else:
-            self.cash = pd.concat([self.cash, new_cash_series])
+            # Buffer updates; they are concatenated lazily on first access
+            self._holdings_blocks.append(
+                pd.DataFrame(target_shares, index=index, columns=columns))
+            self._weights_blocks.append(
+                pd.DataFrame(weights_arr, index=index, columns=columns))
+            self._trades_blocks.append(
+                pd.DataFrame(trades, index=index, columns=columns))
+            self._cash_blocks.append(pd.Series(new_cash, index=index, name='cash'))
+        
+        self._last_shares = pd.Series(target_shares[-1], index=columns)
+        self._last_cash = new_cash[-1]
         
     def calculate_nav(self, prices: pd.DataFrame) -> pd.Series:
         """Calculate Net Asset Value over time."""
-        if self.holdings.empty:
+        holdings = self.holdings
+        if holdings.empty:
             return pd.Series(dtype=float)
-            
-        nav_list = []
-        nav_dates = []
-        
-        for date in self.holdings.index:
-            # Get holdings for this date
-            holdings = self.holdings.loc[date]
-            
-            # Get prices - use forward fill for missing data
-            if date in prices.index:
-                price_row = prices.loc[date]
-            else:
-                # Find the closest available price date
-                valid_dates = prices.index[prices.index <= date]
-                if len(valid_dates) > 0:
-                    price_row = prices.loc[valid_dates[-1]]
-                else:
-                    continue
-            
-            # Ensure holdings and prices are aligned
-            common_assets = holdings.index.intersection(price_row.index)
+        
+        # Ensure holdings and prices are aligned, resolving the columns once;
+        # frames that already share columns (as in the engine) are used as is
+        if holdings.columns.equals(prices.columns):
+            holdings_arr = holdings.to_numpy(dtype=float)
+            prices_arr = prices.to_numpy(dtype=float)
+        else:
+            common_assets = holdings.columns.intersection(prices.columns)
             if len(common_assets) == 0:
-                continue
-                
-            holdings_aligned = holdings.reindex(common_assets, fill_value=0)
-            prices_aligned = price_row.reindex(common_assets, fill_value=0)
-            
-            # Calculate portfolio value
-            portfolio_value = (holdings_aligned * prices_aligned).sum()
-            
-            # Get cash value
-            if date in self.cash.index:
-                cash_value = self.cash.loc[date]
-            else:
-                # Use most recent cash value
-                cash_dates = self.cash.index[self.cash.index <= date]
-                if len(cash_dates) > 0:
-                    cash_value = self.cash.loc[cash_dates[-1]]
-                else:
-                    cash_value = self.initial_capital
-            
-            total_nav = portfolio_value + cash_value
-            
-            nav_list.append(total_nav)
-            nav_dates.append(date)
-        
-        self.nav = pd.Series(nav_list, index=nav_dates, name='nav')
+                self.nav = pd.Series(dtype=float, name='nav')
+                return self.nav
+            holdings_arr = holdings[common_assets].to_numpy(dtype=float)
+            prices_arr = prices[common_assets].to_numpy(dtype=float)
+        
+        dates = holdings.index
+        
+        # Use the most recent available price row for each holdings date;
+        # dates before the first price can't be valued and form a prefix
+        price_idx = np.searchsorted(prices.index.values, dates.values, side='right') - 1
+        first = np.searchsorted(price_idx, 0)
+        
+        # Use the most recent cash balance, or initial capital before the first
+        cash = self.cash
+        if not cash.index.equals(dates):
+            cash = cash.reindex(dates, method='ffill').fillna(self.initial_capital)
+        
+        # Slices (not boolean masks) keep these as views; dtypes must match
+        # exactly since the ahead-of-time kernels don't convert arguments
+        nav = compute_nav(
+            holdings_arr[first:],
+            prices_arr,
+            price_idx[first:].astype(np.int64, copy=False),
+            cash.to_numpy(dtype=float)[first:]
+        )
+        
+        self.nav = pd.Series(nav, index=dates[first:], name='nav')
         return self.nav
     
     def calculate_returns(self) -> pd.Series:
         """Calculate portfolio returns."""
         if len(self.nav) > 1:
-            self.returns = self.nav.pct_change().dropna()
+            self.returns = self.nav.pct_change().dropna().astype(np.float32, copy=False)
         else:
             self.returns = pd.Series(dtype=float, name='returns')
         return self.returns
@@ -154,25 +266,26 @@ class Portfolio:
                 'avg_win': 0,
                 'avg_loss': 0
             }
-            
-        returns = self.returns.dropna()
+        
+        # All return statistics come from a single pass (NaNs skipped)
+        (n, mean, std, max_dd,
+         n_win, sum_win, n_loss, sum_loss) = return_stats(self.returns.to_numpy(dtype=float))
         
         # Annualization factor (assuming daily returns)
-        ann_factor = np.sqrt(252)
+        ann_factor = float(np.sqrt(252))
         
         # Basic metrics
-        total_return = (self.nav.iloc[-1] / self.initial_capital - 1) * 100 if not self.nav.empty else 0
-        annualized_return = returns.mean() * 252 * 100
-        volatility = returns.std() * ann_factor * 100
-        sharpe_ratio = (returns.mean() / returns.std()) * ann_factor if returns.std() > 0 else 0
-        max_drawdown = self._calculate_max_drawdown() * 100
+        # NAV is stored as float32; report plain floats
+        total_return = float(self.nav.iloc[-1] / self.initial_capital - 1) * 100 if not self.nav.empty else 0
+        annualized_return = mean * 252 * 100 if n > 0 else np.nan
+        volatility = std * ann_factor * 100
+        sharpe_ratio = (mean / std) * ann_factor if std > 0 else 0
+        max_drawdown = max_dd * 100
         
         # Win/loss metrics
-        win_rate = (returns > 0).mean() * 100 if len(returns) > 0 else 0
-        winning_returns = returns[returns > 0]
-        losing_returns = returns[returns < 0]
-        avg_win = winning_returns.mean() * 100 if len(winning_returns) > 0 else 0
-        avg_loss = losing_returns.mean() * 100 if len(losing_returns) > 0 else 0
+        win_rate = n_win / n * 100 if n > 0 else 0
+        avg_win = sum_win / n_win * 100 if n_win > 0 else 0
+        avg_loss = sum_loss / n_loss * 100 if n_loss > 0 else 0
         
         metrics = {
             'total_return': total_return,
@@ -185,14 +298,4 @@ class Portfolio:
             'avg_loss': avg_loss
         }
         
-        return metrics
-    
-    def _calculate_max_drawdown(self) -> float:
-        """Calculate maximum drawdown."""
-        if self.returns.empty:
-            return 0
-            
-        cumulative = (1 + self.returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        return drawdown.min()
\ No newline at end of file
+        return metrics
\ No newline at end of file
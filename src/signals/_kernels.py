@@ -0,0 +1,119 @@
+import numpy as np
+from numba import njit
+from typing import Optional
+
+def rolling_mean(x: np.ndarray, window: int,
+                 min_periods: Optional[int] = None) -> np.ndarray:
+    """Rolling mean with pandas semantics, via cumulative sums.
+
+    Like pandas, NaNs and infinities are skipped (an inf in the running sums
+    would otherwise poison every later window).
+    """
+    if min_periods is None:
+        min_periods = window
+    valid = np.isfinite(x)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, x, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    end = np.arange(1, len(x) + 1)
+    start = np.maximum(end - window, 0)
+    window_sum = sums[end] - sums[start]
+    window_count = counts[end] - counts[start]
+
+    out = np.full(len(x), np.nan)
+    ok = (window_count >= min_periods) & (window_count > 0)
+    out[ok] = window_sum[ok] / window_count[ok]
+    return out
+
+def shift(x: np.ndarray, periods: int) -> np.ndarray:
+    """Shift x forward by periods (> 0), filling the start with NaN."""
+    out = np.full(len(x), np.nan)
+    if periods < len(x):
+        out[periods:] = x[:len(x) - periods]
+    return out
+
+@njit(cache=True)
+def rolling_zscore(x: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling z-score of x in one pass, with NaN results filled with 0.
+
+    Matches (x - rolling mean) / (rolling std + 1e-8) with pandas' rolling
+    semantics: NaNs and infinities are skipped in the window statistics,
+    min_periods counts valid observations and std uses ddof=1. Mean and
+    variance are updated with Welford's method as values enter and leave
+    the window.
+    """
+    n = len(x)
+    out = np.empty(n)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        # Drop the value leaving the window
+        if i >= window:
+            old = x[i - window]
+            if np.isfinite(old):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+
+        # Add the value entering the window
+        value = x[i]
+        if np.isfinite(value):
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+
+        if count >= min_periods and count >= 2 and not np.isnan(value):
+            var = m2 / (count - 1)
+            if var < 0.0:
+                var = 0.0
+            out[i] = (value - mean) / (np.sqrt(var) + 1e-8)
+        else:
+            out[i] = 0.0
+    return out
+
+@njit(cache=True)
+def rolling_rank_pct(x: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling percentile rank of each value within its trailing window.
+
+    Matches pandas' rolling(window).rank(pct=True): ties get their average
+    rank, NaNs and infinities are treated as missing and results with fewer
+    than min_periods valid observations are NaN. The window is kept as a
+    sorted buffer, updated by binary search as values enter and leave.
+    """
+    n = len(x)
+    out = np.empty(n)
+    buf = np.empty(window)
+    count = 0
+    for i in range(n):
+        # Drop the value leaving the window
+        if i >= window:
+            old = x[i - window]
+            if np.isfinite(old):
+                pos = np.searchsorted(buf[:count], old)
+                for k in range(pos, count - 1):
+                    buf[k] = buf[k + 1]
+                count -= 1
+
+        # Insert the value entering the window
+        value = x[i]
+        if np.isfinite(value):
+            pos = np.searchsorted(buf[:count], value)
+            for k in range(count, pos, -1):
+                buf[k] = buf[k - 1]
+            buf[pos] = value
+            count += 1
+
+        if count >= min_periods and count > 0 and np.isfinite(value):
+            lo = np.searchsorted(buf[:count], value, side='left')
+            hi = np.searchsorted(buf[:count], value, side='right')
+            out[i] = (lo + (hi - lo + 1) / 2.0) / count
+        else:
+            out[i] = np.nan
+    return out
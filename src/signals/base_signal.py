@@ -1,18 +1,33 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 
+from ._kernels import rolling_rank_pct, rolling_zscore
+
 logger = logging.getLogger(__name__)
 
 class BaseSignal(ABC):
     """Abstract base class for all macro signals."""
     
+    # Names of the params whose values are the macro series this signal reads
+    series_params: Tuple[str, ...] = ()
+    
+    # Number of generated signals kept per instance (least recently used evicted)
+    cache_size: int = 32
+    
     def __init__(self, name: str, params: Optional[Dict[str, Any]] = None):
         self.name = name
         self.params = params or {}
-        self._signal_cache = {}
+        self._signal_cache = OrderedDict()
+    
+    @property
+    def required_series(self) -> Tuple[str, ...]:
+        """Macro series (data columns) required to calculate this signal."""
+        return tuple(self.params[param] for param in self.series_params)
         
     @abstractmethod
     def calculate_raw_signal(self, data: pd.DataFrame) -> pd.Series:
@@ -22,6 +37,13 @@ class BaseSignal(ABC):
     def generate_signal(self, data: pd.DataFrame, 
                        normalize: bool = True) -> pd.Series:
         """Generate trading signal from macro data."""
+        # Reuse the result of an identical earlier call
+        cache_key = self._cache_key(data, normalize)
+        if cache_key is not None and cache_key in self._signal_cache:
+            self._signal_cache.move_to_end(cache_key)
+            logger.debug(f"Using cached {self.name} signal")
+            return self._signal_cache[cache_key].copy()
+        
         # Calculate raw signal
         raw_signal = self.calculate_raw_signal(data)
         
@@ -34,25 +56,47 @@ class BaseSignal(ABC):
         # Apply any signal transformations
         signal = self._apply_transformations(signal)
         
+        if cache_key is not None:
+            self._signal_cache[cache_key] = signal.copy()
+            if len(self._signal_cache) > self.cache_size:
+                self._signal_cache.popitem(last=False)
+        
         logger.info(f"Generated {self.name} signal")
         return signal
     
+    def _cache_key(self, data: pd.DataFrame, normalize: bool) -> Optional[tuple]:
+        """Key a generate_signal call by its input data, params and options.
+        
+        Only the required series (and the index) are hashed; returns None,
+        disabling the cache, if the signal doesn't declare them or they are
+        missing from ``data``.
+        """
+        try:
+            columns = list(self.required_series)
+        except KeyError:
+            return None
+        if not columns or not set(columns).issubset(data.columns):
+            return None
+        
+        row_hashes = pd.util.hash_pandas_object(data[columns], index=True).to_numpy()
+        digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+        return (digest, repr(sorted(self.params.items())), normalize)
+    
     def _normalize_signal(self, signal: pd.Series, 
                          method: str = 'z-score') -> pd.Series:
         """Normalize signal to standard scale."""
         if method == 'z-score':
-            # Rolling z-score normalization
+            # Rolling z-score normalization (single-pass kernel)
             window = self.params.get('zscore_window', 252)
-            mean = signal.rolling(window=window, min_periods=window//2).mean()
-            std = signal.rolling(window=window, min_periods=window//2).std()
-            normalized = (signal - mean) / (std + 1e-8)
-            return normalized.fillna(0)
+            normalized = rolling_zscore(signal.to_numpy(dtype=float), window, window//2)
+            return pd.Series(normalized, index=signal.index, name=signal.name)
         
         elif method == 'percentile':
-            # Rolling percentile rank
+            # Rolling percentile rank (sliding sorted-window kernel)
             window = self.params.get('percentile_window', 252)
-            normalized = signal.rolling(window=window).rank(pct=True)
-            return normalized.fillna(0.5)
+            normalized = rolling_rank_pct(signal.to_numpy(dtype=float), window, window)
+            normalized[np.isnan(normalized)] = 0.5
+            return pd.Series(normalized, index=signal.index, name=signal.name)
         
         else:
             raise ValueError(f"Unknown normalization method: {method}")
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict, Any
 from .base_signal import BaseSignal
+from ._kernels import rolling_mean, shift
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,8 @@ logger = logging.getLogger(__name__)
 class GDPMomentumSignal(BaseSignal):
     """Trading signal based on GDP growth momentum."""
     
+    series_params = ('gdp_column',)
+    
     def __init__(self, params: Optional[Dict[str, Any]] = None):
         default_params = {
             'gdp_column': 'gdp',
@@ -25,15 +28,18 @@ class GDPMomentumSignal(BaseSignal):
         try:
             gdp = data[self.params['gdp_column']]
             
-            # Calculate QoQ growth rate
-            gdp_growth = gdp.pct_change()
+            # Calculate QoQ growth rate (gaps padded first, as pct_change does)
+            gdp_arr = gdp.ffill().to_numpy(dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                gdp_growth = gdp_arr / shift(gdp_arr, 1) - 1
             
-            # Calculate momentum (acceleration)
+            # Calculate momentum (acceleration); the previous average is the
+            # current one shifted back by half a window
             window = self.params['momentum_window']
-            current_avg = gdp_growth.rolling(window=window//2).mean()
-            previous_avg = gdp_growth.shift(window//2).rolling(window=window//2).mean()
+            current_avg = rolling_mean(gdp_growth, window//2)
+            previous_avg = shift(current_avg, window//2)
             
-            momentum = current_avg - previous_avg
+            momentum = pd.Series(current_avg - previous_avg, index=gdp.index, name=gdp.name)
             
             logger.info(f"Calculated GDP momentum: mean={momentum.mean():.4f}, "
                        f"std={momentum.std():.4f}")
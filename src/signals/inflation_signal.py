@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Dict, Any
 from .base_signal import BaseSignal
+from ._kernels import rolling_mean, shift
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,6 +10,8 @@ logger = logging.getLogger(__name__)
 class InflationSurpriseSignal(BaseSignal):
     """Trading signal based on inflation surprises (CPI momentum)."""
     
+    series_params = ('cpi_column',)
+    
     def __init__(self, params: Optional[Dict[str, Any]] = None):
         default_params = {
             'cpi_column': 'cpi',
@@ -25,17 +28,19 @@ class InflationSurpriseSignal(BaseSignal):
         """Calculate inflation surprise signal."""
         try:
             cpi = data[self.params['cpi_column']]
+            cpi_arr = cpi.to_numpy(dtype=float)
             
             # Calculate YoY change
             lookback = self.params['lookback_period']
-            cpi_yoy = (cpi / cpi.shift(lookback) - 1) * 100
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cpi_yoy = (cpi_arr / shift(cpi_arr, lookback) - 1) * 100
             
             # Calculate trend (moving average)
             ma_window = self.params['ma_window']
-            cpi_trend = cpi_yoy.rolling(window=ma_window, min_periods=ma_window//2).mean()
+            cpi_trend = rolling_mean(cpi_yoy, ma_window, ma_window//2)
             
             # Surprise = actual - trend
-            surprise = cpi_yoy - cpi_trend
+            surprise = pd.Series(cpi_yoy - cpi_trend, index=cpi.index, name=cpi.name)
             
             logger.info(f"Calculated inflation surprise: mean={surprise.mean():.2f}, "
                        f"std={surprise.std():.2f}")
@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 class YieldCurveSignal(BaseSignal):
     """Trading signal based on yield curve slope (10Y - 2Y spread)."""
     
+    series_params = ('long_yield', 'short_yield')
+    
     def __init__(self, params: Optional[Dict[str, Any]] = None):
         default_params = {
             'long_yield': 'yield_10y',
@@ -25,15 +27,17 @@ class YieldCurveSignal(BaseSignal):
     def calculate_raw_signal(self, data: pd.DataFrame) -> pd.Series:
         """Calculate yield curve slope."""
         try:
-            long_yield = data[self.params['long_yield']]
-            short_yield = data[self.params['short_yield']]
+            long_yield = data[self.params['long_yield']].to_numpy(dtype=float)
+            short_yield = data[self.params['short_yield']].to_numpy(dtype=float)
             
             # Calculate spread
             spread = long_yield - short_yield
             
             # Invert if specified (useful for different interpretations)
             if self.params.get('invert', False):
-                spread = -spread
+                np.negative(spread, out=spread)
+            
+            spread = pd.Series(spread, index=data.index)
             
             logger.info(f"Calculated yield curve spread: mean={spread.mean():.2f}, "
                        f"std={spread.std():.2f}")
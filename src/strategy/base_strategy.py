@@ -22,16 +22,14 @@ class BaseStrategy(ABC):
         """Calculate portfolio weights based on signals."""
         pass
     
-    def generate_weights(self, signals: pd.DataFrame, 
-                        prices: pd.DataFrame) -> pd.DataFrame:
-        """Generate portfolio weights over time."""
-        weights_list = []
-        
-        # Ensure signals and prices are aligned
-        common_dates = signals.index.intersection(prices.index)
-        signals = signals.loc[common_dates]
-        prices = prices.loc[common_dates]
+    def calculate_weights_vectorized(self, signals: pd.DataFrame, 
+                                     prices: pd.DataFrame) -> pd.DataFrame:
+        """Calculate portfolio weights for every date (row) at once.
         
+        Calls calculate_weights row by row; strategies whose logic can be
+        expressed on whole arrays should override this.
+        """
+        weights_list = []
         for date in signals.index:
             # Calculate weights for this date
             signal_row = signals.loc[date]
@@ -41,7 +39,17 @@ class BaseStrategy(ABC):
             weights_list.append(weights)
         
         # Combine all weights
-        self.weights_history = pd.DataFrame(weights_list, index=signals.index)
+        return pd.DataFrame(weights_list, index=signals.index)
+    
+    def generate_weights(self, signals: pd.DataFrame, 
+                        prices: pd.DataFrame) -> pd.DataFrame:
+        """Generate portfolio weights over time."""
+        # Ensure signals and prices are aligned
+        common_dates = signals.index.intersection(prices.index)
+        signals = signals.loc[common_dates]
+        prices = prices.loc[common_dates]
+        
+        self.weights_history = self.calculate_weights_vectorized(signals, prices)
         
         # Apply any constraints
         self.weights_history = self._apply_constraints(self.weights_history)
@@ -50,15 +58,19 @@ class BaseStrategy(ABC):
     
     def _apply_constraints(self, weights: pd.DataFrame) -> pd.DataFrame:
         """Apply portfolio constraints (leverage, position limits, etc.)."""
-        # Apply leverage constraint
+        # Work on a private copy so both constraints can be applied in place
+        values = weights.to_numpy(dtype=float, copy=True)
+        
+        # Apply leverage constraint, rescaling only the rows that exceed it
         max_leverage = self.params.get('max_leverage', 1.0)
-        leverage = weights.abs().sum(axis=1)
-        scaling_factor = max_leverage / leverage.clip(lower=max_leverage)
-        weights = weights.multiply(scaling_factor, axis=0)
+        leverage = np.nansum(np.abs(values), axis=1)
+        over = leverage > max_leverage
+        if over.any():
+            values[over] *= (max_leverage / leverage[over])[:, None]
         
         # Apply position limits
         if 'max_position_size' in self.params:
             max_size = self.params['max_position_size']
-            weights = weights.clip(-max_size, max_size)
+            np.clip(values, -max_size, max_size, out=values)
         
-        return weights
\ No newline at end of file
+        return pd.DataFrame(values, index=weights.index, columns=weights.columns, copy=False)
\ No newline at end of file
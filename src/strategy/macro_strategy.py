@@ -33,6 +33,12 @@ class MacroStrategy(BaseStrategy):
         super().__init__(name, universe, default_params)
         self.signal_weights = signal_weights
         
+        # Signal weights as a fixed vector, normalized as in calculate_weights
+        self._signal_names = list(signal_weights.keys())
+        self._signal_w = np.array(list(signal_weights.values()), dtype=np.float64)
+        if self._signal_w.sum() > 0:
+            self._signal_w /= self._signal_w.sum()
+        
     def calculate_weights(self, signals: Union[pd.Series, float], 
                          prices: pd.Series) -> pd.Series:
         """Calculate portfolio weights based on combined signal."""
@@ -73,4 +79,40 @@ class MacroStrategy(BaseStrategy):
                 weights['SPY'] = 0.5
                 weights['TLT'] = 0.5
         
-        return weights
\ No newline at end of file
+        return weights
+    
+    def calculate_weights_vectorized(self, signals: pd.DataFrame, 
+                                     prices: pd.DataFrame) -> pd.DataFrame:
+        """Calculate weights for all dates with array operations."""
+        # Weighted average of the signals we have, as in calculate_weights
+        present = signals.columns.get_indexer(self._signal_names) >= 0
+        if present.all():
+            combined_signal = signals[self._signal_names].to_numpy(dtype=float) @ self._signal_w
+        else:
+            # Re-weight over the subset of signals present
+            names = [name for name, ok in zip(self._signal_names, present) if ok]
+            weights_vec = np.array([self.signal_weights[name] for name in names], dtype=float)
+            combined_signal = signals[names].to_numpy(dtype=float) @ weights_vec
+            if weights_vec.sum() > 0:
+                combined_signal /= weights_vec.sum()
+        
+        # Simple threshold-based allocation
+        threshold = self.params['signal_threshold']
+        risk_on = combined_signal > threshold
+        risk_off = combined_signal < -threshold
+        
+        weights = np.zeros((len(signals.index), len(self.universe)))
+        has_spy = 'SPY' in self.universe
+        has_tlt = 'TLT' in self.universe
+        neutral = 0.5 if has_spy and has_tlt else 0.0
+        
+        if has_spy:
+            # Risk-on: Long equities
+            weights[:, self.universe.index('SPY')] = np.where(
+                risk_on, 1.0, np.where(risk_off, 0.0, neutral))
+        if has_tlt:
+            # Risk-off: Long bonds
+            weights[:, self.universe.index('TLT')] = np.where(
+                risk_off, 1.0, np.where(risk_on, 0.0, neutral))
+        
+        return pd.DataFrame(weights, index=signals.index, columns=self.universe)
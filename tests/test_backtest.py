@@ -1,11 +1,33 @@
+import json
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from src.backtest.engine import BacktestEngine
+from src.data import asset_price_loader
+from src.data.asset_price_loader import AssetPriceLoader
+from src.data.macro_data_loader import MacroDataLoader
 from src.portfolio.portfolio import Portfolio
+from src.signals.gdp_momentum_signal import GDPMomentumSignal
+from src.signals.inflation_signal import InflationSurpriseSignal
+from src.signals.yield_curve_signal import YieldCurveSignal
 from src.strategy.macro_strategy import MacroStrategy
 
+@pytest.fixture
+def rebalance_data():
+    """Daily rebalance dates with prices and target weights for SPY/TLT."""
+    dates = pd.date_range('2023-01-01', '2023-01-05', freq='D')
+    prices = pd.DataFrame({
+        'SPY': [400, 405, 410, 408, 412],
+        'TLT': [100, 99, 98, 99, 100]
+    }, index=dates, dtype=float)
+    weights = pd.DataFrame({
+        'SPY': [0.6, 1.0, 0.5, 0.0, 0.5],
+        'TLT': [0.4, 0.0, 0.5, 1.0, 0.5]
+    }, index=dates)
+    return dates, prices, weights
+
 class TestPortfolio:
     def test_portfolio_initialization(self):
         portfolio = Portfolio(initial_capital=1000000)
@@ -32,6 +54,104 @@ class TestPortfolio:
         assert len(nav) == 1
         assert nav.iloc[0] > 0
 
+    def test_batch_update_matches_sequential(self, rebalance_data):
+        dates, prices, weights = rebalance_data
+        sequential = Portfolio(initial_capital=100000)
+        for date in dates:
+            sequential.update_holdings(weights.loc[date], prices.loc[date], date)
+
+        batched = Portfolio(initial_capital=100000)
+        batched.update_holdings_batch(weights, prices)
+
+        pd.testing.assert_frame_equal(batched.holdings, sequential.holdings,
+                                      check_freq=False)
+        pd.testing.assert_frame_equal(batched.trades, sequential.trades,
+                                      check_freq=False)
+        pd.testing.assert_series_equal(batched.cash, sequential.cash,
+                                       check_freq=False)
+
+    def test_nan_price_on_zero_weight_asset(self, rebalance_data):
+        dates, prices, weights = rebalance_data
+        # GLD isn't listed yet on the first date and is never held
+        prices_gld = prices.assign(GLD=[np.nan, 180.0, 181.0, 182.0, 183.0])
+        weights_gld = weights.assign(GLD=0.0)
+
+        without = Portfolio(initial_capital=100000)
+        without.update_holdings_batch(weights, prices)
+        with_gld = Portfolio(initial_capital=100000)
+        with_gld.update_holdings_batch(weights_gld, prices_gld)
+
+        pd.testing.assert_series_equal(with_gld.cash, without.cash, check_freq=False)
+        pd.testing.assert_series_equal(with_gld.calculate_nav(prices_gld),
+                                       without.calculate_nav(prices), check_freq=False)
+
+    @pytest.mark.parametrize('values', [
+        [0.01, -0.02, 0.015, 0.0, -0.005, 0.03, -0.01],
+        [-0.03, -0.01, 0.02, -0.015, 0.0, 0.01, 0.025],
+    ])
+    def test_performance_metrics_match_pandas(self, values):
+        portfolio = Portfolio(initial_capital=100000)
+        returns = pd.Series(values)
+        portfolio.returns = returns
+        portfolio.nav = 100000 * (1 + returns).cumprod()
+
+        metrics = portfolio.get_performance_metrics()
+
+        cumulative = (1 + returns).cumprod()
+        drawdown = (cumulative - cumulative.expanding().max()) / cumulative.expanding().max()
+        assert metrics['annualized_return'] == pytest.approx(returns.mean() * 252 * 100)
+        assert metrics['volatility'] == pytest.approx(returns.std() * np.sqrt(252) * 100)
+        assert metrics['max_drawdown'] == pytest.approx(drawdown.min() * 100)
+        assert metrics['win_rate'] == pytest.approx((returns > 0).mean() * 100)
+        assert metrics['avg_win'] == pytest.approx(returns[returns > 0].mean() * 100)
+        assert metrics['avg_loss'] == pytest.approx(returns[returns < 0].mean() * 100)
+
+    def test_metrics_are_plain_floats(self):
+        portfolio = Portfolio(initial_capital=100000)
+        # NAV and returns are stored as float32
+        returns = pd.Series([0.01, -0.02, 0.015], dtype=np.float32)
+        portfolio.returns = returns
+        portfolio.nav = (100000 * (1 + returns).cumprod()).astype(np.float32)
+
+        metrics = portfolio.get_performance_metrics()
+
+        assert all(type(value) in (int, float) for value in metrics.values())
+        json.dumps(metrics)
+
+    def test_max_drawdown_starts_from_first_period(self):
+        portfolio = Portfolio(initial_capital=100000)
+        # A loss in the first period sets the starting peak, it isn't a drawdown
+        portfolio.returns = pd.Series([-0.05, 0.01, 0.02])
+
+        assert portfolio.get_performance_metrics()['max_drawdown'] == 0.0
+
+        # Later declines are measured from the running peak after that
+        portfolio.returns = pd.Series([-0.05, 0.02, -0.03, 0.01])
+        assert portfolio.get_performance_metrics()['max_drawdown'] == pytest.approx(-3.0)
+
+    def test_preallocated_updates_match_blocks(self, rebalance_data):
+        dates, prices, weights = rebalance_data
+        buffered = Portfolio(initial_capital=100000)
+        preallocated = Portfolio(initial_capital=100000)
+        preallocated.preallocate(dates, ['SPY', 'TLT'])
+        for date in dates[:3]:
+            buffered.update_holdings(weights.loc[date], prices.loc[date], date)
+            preallocated.update_holdings(weights.loc[date], prices.loc[date], date)
+
+        # Only the rows written so far are exposed
+        pd.testing.assert_frame_equal(preallocated.holdings, buffered.holdings,
+                                      check_freq=False)
+
+        buffered.update_holdings_batch(weights.iloc[3:], prices.iloc[3:])
+        preallocated.update_holdings_batch(weights.iloc[3:], prices.iloc[3:])
+
+        pd.testing.assert_frame_equal(preallocated.holdings, buffered.holdings,
+                                      check_freq=False)
+        pd.testing.assert_frame_equal(preallocated.weights, buffered.weights,
+                                      check_freq=False)
+        pd.testing.assert_series_equal(preallocated.cash, buffered.cash,
+                                       check_freq=False)
+
 class TestStrategy:
     def test_macro_strategy_weights(self):
         strategy = MacroStrategy(
@@ -47,4 +167,134 @@ class TestStrategy:
         weights = strategy.calculate_weights(signals, prices)
         
         assert isinstance(weights, pd.Series)
-        assert weights.sum() <= 1.0 + 1e-6
\ No newline at end of file
+        assert weights.sum() <= 1.0 + 1e-6
+
+    def test_vectorized_weights_match_row_by_row(self):
+        strategy = MacroStrategy(
+            name="TestStrategy",
+            universe=["SPY", "TLT", "GLD"],
+            signal_weights={"a": 0.6, "b": 0.4}
+        )
+
+        dates = pd.date_range('2023-01-01', periods=50, freq='D')
+        rng = np.random.default_rng(0)
+        signals = pd.DataFrame(rng.normal(0, 1, (50, 2)), index=dates, columns=['a', 'b'])
+        signals.iloc[3, 0] = np.nan
+        prices = pd.DataFrame(100.0, index=dates, columns=strategy.universe)
+
+        expected = pd.DataFrame(
+            [strategy.calculate_weights(signals.loc[d], prices.loc[d]) for d in dates],
+            index=dates
+        )
+        result = strategy.calculate_weights_vectorized(signals, prices)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+
+class FailingVectorizedStrategy(MacroStrategy):
+    def calculate_weights_vectorized(self, signals, prices):
+        raise RuntimeError("vectorized weights unavailable")
+
+@pytest.fixture
+def engine_factory(monkeypatch):
+    """Build engines whose FRED and yfinance requests return synthetic data."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2020-01-01', '2021-12-31')
+    fred_data = pd.DataFrame({
+        'DGS10': 2.5 + np.cumsum(rng.normal(0, 0.03, len(dates))),
+        'DGS2': 1.5 + np.cumsum(rng.normal(0, 0.03, len(dates))),
+        'CPIAUCSL': 100 * np.cumprod(1 + rng.normal(1e-4, 1e-3, len(dates))),
+        'GDP': 1e4 * np.cumprod(1 + rng.normal(1e-4, 1e-3, len(dates))),
+    }, index=dates)
+    closes = pd.DataFrame({
+        ticker: 100 * np.cumprod(1 + rng.normal(3e-4, 1e-2, len(dates)))
+        for ticker in ['SPY', 'TLT', 'GLD']
+    }, index=dates)
+    # GLD only lists in mid-February, so the January rebalance has no price
+    closes.loc[:'2020-02-14', 'GLD'] = np.nan
+
+    def download(tickers, start, end, **kwargs):
+        symbols = [ticker.upper() for ticker in tickers.split()]
+        data = closes.loc[start:end, symbols]
+        data.columns = pd.MultiIndex.from_product([symbols, ['Close']])
+        return data
+    monkeypatch.setattr(asset_price_loader.yf, 'download', download)
+
+    def create(strategy_cls=MacroStrategy):
+        macro_loader = MacroDataLoader('key', {'cache_dir': None})
+        # fredapi returns unnamed series
+        monkeypatch.setattr(macro_loader.fred, 'get_series',
+                            lambda series, start, end: fred_data[series].rename(None))
+        strategy = strategy_cls(
+            name="TestStrategy",
+            universe=['SPY', 'TLT', 'GLD'],
+            signal_weights={'yield_curve': 0.4, 'inflation_surprise': 0.3,
+                            'gdp_momentum': 0.3}
+        )
+        signals = {
+            'yield_curve': YieldCurveSignal(),
+            'inflation_surprise': InflationSurpriseSignal(),
+            'gdp_momentum': GDPMomentumSignal(),
+        }
+        return BacktestEngine(macro_loader, AssetPriceLoader({'cache_dir': None}),
+                              signals, strategy, {'initial_capital': 100000})
+    return create
+
+class TestBacktestEngine:
+    def test_run_matches_per_date_portfolio(self, engine_factory):
+        engine = engine_factory()
+        portfolio = engine.run('2020-01-01', '2021-12-31')
+
+        # Reference: rebalance on the first date on or after each month end,
+        # skipping dates with missing prices, one update at a time
+        dates = engine.price_data.index
+        rebalance_dates = list(dict.fromkeys(
+            dates[min(dates.searchsorted(d), len(dates) - 1)]
+            for d in pd.date_range(dates[0], dates[-1], freq='ME')
+        ))
+        reference = Portfolio(initial_capital=100000)
+        for date in rebalance_dates:
+            prices = engine.price_data.loc[date].astype(float)
+            if prices.isna().any():
+                continue
+            signals = engine.signal_data.loc[date].astype(float).fillna(0.0)
+            weights = engine.strategy.calculate_weights(signals, prices)
+            reference.update_holdings(weights, prices, date)
+        reference.calculate_nav(engine.price_data)
+        reference.calculate_returns()
+
+        assert pd.Timestamp('2020-01-31') not in portfolio.holdings.index
+        assert len(portfolio.holdings) == len(reference.holdings) == 23
+        pd.testing.assert_frame_equal(portfolio.weights, reference.weights,
+                                      check_freq=False)
+        np.testing.assert_allclose(portfolio.nav, reference.nav, rtol=1e-6)
+
+        metrics = engine.evaluate()
+        expected = reference.get_performance_metrics()
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value, rel=1e-4, abs=1e-6), key
+        for name in engine.signals:
+            assert metrics[f'{name}_mean'] == pytest.approx(
+                engine.signal_data[name].astype(float).mean(), rel=1e-5)
+        assert metrics['avg_daily_turnover'] == pytest.approx(
+            reference.trades.abs().sum(axis=1).mean(), rel=1e-5)
+
+        summary = engine.get_results_summary()
+        assert list(summary.columns) == (
+            ['NAV', 'Returns', 'Cash', 'Weight_SPY', 'Weight_TLT', 'Weight_GLD']
+            + [f'Signal_{name}' for name in engine.signals])
+        pd.testing.assert_index_equal(summary.index, portfolio.nav.index)
+        np.testing.assert_allclose(summary['NAV'], reference.nav, rtol=1e-6)
+        np.testing.assert_allclose(
+            summary['Weight_SPY'],
+            reference.weights['SPY'].reindex(summary.index, method='ffill'))
+
+    def test_vectorized_failure_falls_back_per_date(self, engine_factory):
+        engine = engine_factory()
+        engine.run('2020-01-01', '2021-12-31')
+        fallback = engine_factory(FailingVectorizedStrategy)
+        fallback.run('2020-01-01', '2021-12-31')
+
+        pd.testing.assert_frame_equal(fallback.portfolio.weights, engine.portfolio.weights)
+        pd.testing.assert_series_equal(fallback.portfolio.nav, engine.portfolio.nav)
+        assert fallback.evaluate() == engine.evaluate()
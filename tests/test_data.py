@@ -0,0 +1,174 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.data import asset_price_loader
+from src.data.asset_price_loader import AssetPriceLoader
+from src.data.base_loader import BaseDataLoader
+from src.data.macro_data_loader import MacroDataLoader
+
+class DummyLoader(BaseDataLoader):
+    def fetch_data(self, identifier, start_date, end_date):
+        return pd.DataFrame()
+
+class TestDiskCache:
+    def test_cache_round_trip(self, tmp_path):
+        dates = pd.date_range('2023-01-01', '2023-01-05', freq='D')
+        data = pd.DataFrame({'SPY': np.arange(5, dtype=float)}, index=dates)
+
+        loader = DummyLoader({'cache_dir': tmp_path})
+        loader.cache_data('SPY_2023-01-01_2023-01-05_Close', data)
+
+        # A fresh loader only sees the on-disk copy
+        fresh = DummyLoader({'cache_dir': tmp_path})
+        cached = fresh.get_cached_data('SPY_2023-01-01_2023-01-05_Close')
+
+        assert cached is not None
+        pd.testing.assert_frame_equal(cached, data, check_freq=False)
+        assert not cached['SPY'].to_numpy().flags.writeable
+        assert fresh.get_cached_data('TLT_2023-01-01_2023-01-05_Close') is None
+
+    def test_cached_data_is_read_only(self, tmp_path):
+        data = pd.DataFrame({'SPY': np.arange(3, dtype=float)})
+        loader = DummyLoader({'cache_dir': None})
+        loader.cache_data('key', data)
+
+        # Cached values are shared, not copied, so writing to them raises
+        retrieved = loader.get_cached_data('key')
+        with pytest.raises(ValueError, match='read-only'):
+            data.iloc[0, 0] = -1.0
+        with pytest.raises(ValueError, match='read-only'):
+            retrieved.iloc[1, 0] = -1.0
+
+        # Replacing a column only affects the retrieved frame
+        retrieved['SPY'] = -1.0
+        np.testing.assert_array_equal(loader.get_cached_data('key')['SPY'], [0.0, 1.0, 2.0])
+
+    def test_unwritable_cache_dir_disables_cache(self, tmp_path):
+        # A file where the directory should be makes mkdir fail
+        blocker = tmp_path / 'blocker'
+        blocker.write_text('')
+
+        loader = DummyLoader({'cache_dir': blocker / 'cache'})
+
+        assert loader.cache_dir is None
+
+    def test_cache_disabled(self, tmp_path):
+        loader = DummyLoader({'cache_dir': None})
+        loader.cache_data('key', pd.DataFrame({'a': [1.0]}))
+
+        assert loader.cache_dir is None
+        assert DummyLoader({'cache_dir': None}).get_cached_data('key') is None
+
+def fake_download(tickers, start, end, group_by='column', **kwargs):
+    """Mimic yfinance's download layout: upper-cased tickers, MultiIndex columns."""
+    symbols = [ticker.upper() for ticker in tickers.split()]
+    dates = pd.bdate_range(start, end, inclusive='left')
+    columns = pd.MultiIndex.from_product([symbols, ['Close', 'Open']],
+                                         names=['Ticker', 'Price'])
+    values = np.arange(len(dates) * len(columns), dtype=float).reshape(len(dates), -1)
+    data = pd.DataFrame(values, index=dates, columns=columns)
+    if group_by != 'ticker':
+        data = data.swaplevel(axis=1)
+    return data
+
+class TestAssetPriceLoader:
+    def test_fetch_data_keeps_requested_ticker(self, monkeypatch):
+        monkeypatch.setattr(asset_price_loader.yf, 'download', fake_download)
+        loader = AssetPriceLoader({'cache_dir': None})
+
+        prices = loader.fetch_data('spy', '2023-01-02', '2023-01-07')
+
+        assert list(prices.columns) == ['spy']
+        assert len(prices) == 5
+
+
+    def test_fetch_multiple_assets_batches_and_combines(self, monkeypatch):
+        calls = []
+        def download(tickers, start, end, **kwargs):
+            calls.append(tickers)
+            data = fake_download(tickers, start, end, **kwargs)
+            # TLT has no price on the first date
+            data.iloc[0, data.columns.get_loc(('TLT', 'Close'))] = np.nan
+            return data
+        monkeypatch.setattr(asset_price_loader.yf, 'download', download)
+        loader = AssetPriceLoader({'cache_dir': None})
+
+        prices = loader.fetch_multiple_assets(['spy', 'TLT'], '2023-01-02', '2023-01-07')
+
+        expected = fake_download('SPY TLT', '2023-01-02', '2023-01-07', group_by='ticker')
+        assert calls == ['spy TLT']
+        assert list(prices.columns) == ['spy', 'TLT']
+        assert (prices.dtypes == np.float32).all()
+        pd.testing.assert_index_equal(prices.index, expected.index, check_names=False)
+        np.testing.assert_array_equal(prices['spy'], expected[('SPY', 'Close')])
+        assert np.isnan(prices['TLT'].iloc[0])
+        np.testing.assert_array_equal(prices['TLT'].iloc[1:], expected[('TLT', 'Close')].iloc[1:])
+
+        # A repeat request is served from the cache
+        loader.fetch_multiple_assets(['spy', 'TLT'], '2023-01-02', '2023-01-07')
+        assert calls == ['spy TLT']
+
+    def test_fetch_multiple_assets_retries_missing_tickers(self, monkeypatch):
+        calls = []
+        def download(tickers, start, end, **kwargs):
+            calls.append(tickers)
+            data = fake_download(tickers, start, end, **kwargs)
+            if ' ' in tickers:
+                # The batched request comes back empty for GLD
+                data.loc[:, ('GLD', slice(None))] = np.nan
+            return data
+        monkeypatch.setattr(asset_price_loader.yf, 'download', download)
+        loader = AssetPriceLoader({'cache_dir': None})
+
+        prices = loader.fetch_multiple_assets(['SPY', 'GLD'], '2023-01-02', '2023-01-07')
+
+        assert calls == ['SPY GLD', 'GLD']
+        assert list(prices.columns) == ['SPY', 'GLD']
+        assert not prices.isna().any().any()
+
+    def test_fetch_multiple_assets_flat_single_ticker(self, monkeypatch):
+        def download(tickers, start, end, **kwargs):
+            # Older yfinance drops the ticker level for a single ticker
+            return fake_download(tickers, start, end, **kwargs).droplevel(0, axis=1)
+        monkeypatch.setattr(asset_price_loader.yf, 'download', download)
+        loader = AssetPriceLoader({'cache_dir': None})
+
+        prices = loader.fetch_multiple_assets(['spy'], '2023-01-02', '2023-01-07')
+
+        assert list(prices.columns) == ['spy']
+        assert len(prices) == 5
+
+class TestMacroDataLoader:
+    def test_dtype_backend_applies_to_cache_hits(self, tmp_path, monkeypatch):
+        dates = pd.date_range('2023-01-01', periods=5, freq='D')
+        def get_series(series, start, end):
+            return pd.Series(np.arange(5, dtype=float), index=dates)
+
+        loaders = {}
+        for backend in ('pyarrow', None):
+            loader = MacroDataLoader('key', {'cache_dir': tmp_path, 'dtype_backend': backend})
+            monkeypatch.setattr(loader.fred, 'get_series', get_series)
+            loaders[backend] = loader
+
+        # Whichever backend wrote the cache, each loader returns its own
+        arrow = loaders['pyarrow'].fetch_data('cpi', '2023-01-01', '2023-01-05')
+        default = loaders[None].fetch_data('cpi', '2023-01-01', '2023-01-05')
+        assert isinstance(arrow['cpi'].dtype, pd.ArrowDtype)
+        assert default['cpi'].dtype == np.float64
+
+        combined = loaders['pyarrow'].fetch_multiple_series(['cpi'], '2023-01-01', '2023-01-05')
+        assert isinstance(combined['cpi'].dtype, pd.ArrowDtype)
+
+    @pytest.mark.parametrize('periods', [1, 3, 0, -2])
+    def test_calculate_changes_match_pandas(self, periods):
+        data = pd.DataFrame({
+            'cpi': [100.0, 101.0, 0.0, 102.0, 103.5, 104.0, 103.0],
+            'gdp': [1.0, np.nan, 2.0, 2.5, 2.0, 3.0, 3.5],
+        })
+
+        pct = MacroDataLoader.calculate_changes_np(data.to_numpy(), periods, pct=True)
+        diff = MacroDataLoader.calculate_changes_np(data.to_numpy(), periods, pct=False)
+
+        np.testing.assert_array_equal(pct, data.pct_change(periods, fill_method=None).to_numpy())
+        np.testing.assert_array_equal(diff, data.diff(periods).to_numpy())
@@ -5,6 +5,8 @@ from datetime import datetime, timedelta
 
 from src.signals.yield_curve_signal import YieldCurveSignal
 from src.signals.inflation_signal import InflationSurpriseSignal
+from src.signals.gdp_momentum_signal import GDPMomentumSignal
+from src.signals._kernels import rolling_rank_pct, rolling_zscore
 
 class TestYieldCurveSignal:
     def test_signal_generation(self):
@@ -26,6 +28,35 @@ class TestYieldCurveSignal:
         assert len(result) == len(dates)
         assert not result.isna().all()
 
+    def test_required_series_follow_params(self):
+        assert YieldCurveSignal().required_series == ('yield_10y', 'yield_2y')
+
+        signal = YieldCurveSignal(params={'long_yield': 'yield_30y'})
+        assert signal.required_series == ('yield_30y', 'yield_2y')
+
+    def test_generate_signal_is_memoized(self):
+        dates = pd.date_range('2020-01-01', '2021-12-31', freq='D')
+        data = pd.DataFrame({
+            'yield_10y': np.random.normal(2.5, 0.5, len(dates)),
+            'yield_2y': np.random.normal(1.5, 0.3, len(dates)),
+            'cpi': np.random.normal(100, 1, len(dates))
+        }, index=dates)
+
+        signal = YieldCurveSignal()
+        first = signal.generate_signal(data)
+
+        # Unrelated columns don't affect the key; the cached result is a copy
+        repeat = signal.generate_signal(data.drop(columns='cpi'))
+        pd.testing.assert_series_equal(repeat, first)
+        assert len(signal._signal_cache) == 1
+        repeat.iloc[:] = 0.0
+        pd.testing.assert_series_equal(signal.generate_signal(data), first)
+
+        changed = data.copy()
+        changed.iloc[-1, 0] += 1.0
+        signal.generate_signal(changed)
+        assert len(signal._signal_cache) == 2
+
 class TestInflationSignal:
     def test_signal_generation(self):
         # Create sample data
@@ -43,4 +74,82 @@ class TestInflationSignal:
         
         # Assertions
         assert isinstance(result, pd.Series)
-        assert len(result) == len(dates)
\ No newline at end of file
+        assert len(result) == len(dates)
+
+class TestRawSignalsMatchPandas:
+    """The array-based raw signals against their pandas formulations."""
+
+    @pytest.fixture
+    def data(self):
+        rng = np.random.default_rng(3)
+        dates = pd.date_range('2020-01-01', periods=120, freq='D')
+        data = pd.DataFrame({
+            'yield_10y': rng.normal(2.5, 0.5, len(dates)),
+            'yield_2y': rng.normal(1.5, 0.3, len(dates)),
+            'cpi': rng.normal(100, 1, len(dates)),
+            'gdp': rng.normal(1e4, 50, len(dates)),
+        }, index=dates)
+        # Zero levels make the growth rates infinite further on
+        data.iloc[30, 2] = 0.0
+        data.iloc[60, 3] = 0.0
+        return data
+
+    def test_yield_curve(self, data):
+        expected = data['yield_10y'] - data['yield_2y']
+
+        result = YieldCurveSignal().calculate_raw_signal(data)
+
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+    def test_inflation_surprise(self, data):
+        cpi = data['cpi']
+        cpi_yoy = (cpi / cpi.shift(12) - 1) * 100
+        expected = cpi_yoy - cpi_yoy.rolling(window=12, min_periods=6).mean()
+
+        result = InflationSurpriseSignal().calculate_raw_signal(data)
+
+        assert np.isinf(result).any()
+        pd.testing.assert_series_equal(result, expected, check_names=False, rtol=1e-12)
+
+    def test_gdp_momentum(self, data):
+        growth = data['gdp'].pct_change()
+        expected = growth.rolling(window=2).mean() - growth.shift(2).rolling(window=2).mean()
+
+        result = GDPMomentumSignal().calculate_raw_signal(data)
+
+        pd.testing.assert_series_equal(result, expected, check_names=False, rtol=1e-12)
+
+class TestSignalKernels:
+    def test_rolling_zscore_matches_pandas(self):
+        rng = np.random.default_rng(42)
+        values = rng.normal(2.0, 0.5, 600)
+        values[rng.random(600) < 0.1] = np.nan
+        values[[150, 400]] = [np.inf, -np.inf]
+        series = pd.Series(values)
+
+        window = 100
+        mean = series.rolling(window=window, min_periods=window//2).mean()
+        std = series.rolling(window=window, min_periods=window//2).std()
+        expected = ((series - mean) / (std + 1e-8)).fillna(0)
+
+        result = rolling_zscore(values, window, window//2)
+
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+    def test_rolling_rank_pct_matches_pandas(self):
+        rng = np.random.default_rng(7)
+        # Rounded values produce ties, which pandas ranks by their average
+        values = np.round(rng.normal(0.0, 1.0, 600), 1)
+        values[rng.random(600) < 0.02] = np.nan
+        values[[150, 400]] = [np.inf, -np.inf]
+
+        # Also a partial min_periods, so windows with missing values still rank
+        window = 50
+        for min_periods in (window, window // 2):
+            rolling = pd.Series(values).rolling(window=window, min_periods=min_periods)
+            expected = rolling.rank(pct=True)
+
+            result = rolling_rank_pct(values, window, min_periods)
+
+            assert not np.isnan(result).all()
+            np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-12)